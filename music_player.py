@@ -1,20 +1,110 @@
 import tkinter as tk
 from tkinter import filedialog, messagebox, ttk, simpledialog
+import tkinter.font as tkfont
 import pygame
 import os
-from pathlib import Path
+import sys
 from mutagen import File as MutagenFile
 import threading
+import queue
+import concurrent.futures
 import time
 import re
+import json
+import functools
+import sqlite3
+from collections.abc import MutableMapping
 
 try:
     import vlc  # type: ignore
 except Exception:
     vlc = None
 
+AUDIO_EXTENSIONS = frozenset({'.mp3', '.wav', '.ogg', '.flac', '.m4a'})
+
+# Title tags in lookup order: ID3v2 (MP3), then Vorbis/FLAC style
+TITLE_TAG_KEYS = ('TIT2', 'TITLE')
+
+# "Artist - Title" separators, most specific first
+TITLE_SEPARATORS = (' - ', ' – ', ' — ', '-', '_')
+
+# Leading track number such as "01. " or "3 - "
+_LEAD_NUM_RE = re.compile(r'^\d+[.\s\-_]+')
+
+# Folder scans hand discovered files to the UI thread in batches of this size
+SCAN_BATCH_SIZE = 128
+
+# Built-in playlists that can't be deleted or picked as an "Add to Playlist" target
+_RESERVED = frozenset({"All", "Favourite"})
+
+# Saved playlists (everything except the "All" library view)
+PLAYLIST_DB_PATH = os.path.join(os.path.expanduser("~"), ".music_player_playlists.db")
+
+# Rows of a newly selected playlist queued for title lookup per idle turn
+PLAYLIST_CHUNK_SIZE = 200
+
+# How long (seconds) a file existence check is trusted before playing
+EXISTS_CACHE_TTL = 5.0
+
+# Expired existence checks are pruned once the cache holds this many entries
+EXISTS_CACHE_PRUNE_SIZE = 64
+
+# Persistent title cache: {path: [mtime, size, title]}
+META_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".music_player_meta.json")
+
+
+def _canonical_path(file_path):
+    """Normalized, interned form every stored song path takes, so copies compare by identity"""
+    return sys.intern(os.path.normpath(file_path))
+
+
+def _iter_audio_files(folder_path):
+    """Yield paths of audio files under folder_path (like os.walk, unreadable folders are skipped)"""
+    stack = [folder_path]
+    while stack:
+        subdirs = []
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+                    else:
+                        name = entry.name
+                        dot = name.rfind('.')
+                        if dot != -1 and name[dot:].lower() in AUDIO_EXTENSIONS:
+                            yield entry.path
+        except OSError:
+            pass  # Unreadable or failed mid-listing; subfolders seen so far are still walked
+        # Reversed so subfolders are visited in listing order
+        stack.extend(reversed(subdirs))
+
+
+@functools.lru_cache(maxsize=4096)
+def _read_song_title(file_path, mtime, size):
+    """Read the title tag of an audio file (mtime/size only key the memo)"""
+    try:
+        audio_file = MutagenFile(file_path)
+        if audio_file is not None:
+            title = None
+            
+            # Try different tag formats for title
+            for key in TITLE_TAG_KEYS:
+                if key in audio_file:
+                    title = str(audio_file[key][0]).strip()
+                    break
+            
+            # If we found a title, return it
+            if title and title != 'Unknown' and title != '':
+                return title
+    except Exception:
+        pass
+    return None
+
 class HoverButton(tk.Button):
     """Custom button class with hover effects"""
+    # Hover handlers are bound once on this tag and shared by every instance
+    BINDTAG = 'HoverButton'
+    
     def __init__(self, master, hover_color=None, **kwargs):
         self.default_bg = kwargs.get('bg', '#4a4a4a')
         self.hover_bg = hover_color if hover_color else self.lighten_color(self.default_bg)
@@ -22,15 +112,16 @@ class HoverButton(tk.Button):
         
         kwargs['relief'] = kwargs.get('relief', tk.FLAT)
         kwargs['bd'] = kwargs.get('bd', 0)
-        kwargs['cursor'] = kwargs.get('cursor', 'hand2')
         kwargs['font'] = kwargs.get('font', ('Segoe UI', 10))
         
         super().__init__(master, **kwargs)
         
-        self.bind('<Enter>', self.on_enter)
-        self.bind('<Leave>', self.on_leave)
-        self.bind('<Button-1>', self.on_click)
-        self.bind('<ButtonRelease-1>', self.on_release)
+        if not self.bind_class(self.BINDTAG):
+            self.bind_class(self.BINDTAG, '<Enter>', lambda e: e.widget.on_enter(e))
+            self.bind_class(self.BINDTAG, '<Leave>', lambda e: e.widget.on_leave(e))
+            self.bind_class(self.BINDTAG, '<Button-1>', lambda e: e.widget.on_click(e))
+            self.bind_class(self.BINDTAG, '<ButtonRelease-1>', lambda e: e.widget.on_release(e))
+        self.bindtags((self.BINDTAG,) + self.bindtags())
     
     def on_enter(self, event):
         self.config(bg=self.hover_bg)
@@ -45,7 +136,9 @@ class HoverButton(tk.Button):
         self.config(relief=tk.FLAT)
         self.config(bg=self.hover_bg)
     
-    def lighten_color(self, color):
+    @staticmethod
+    @functools.lru_cache(maxsize=64)
+    def lighten_color(color):
         """Lighten a hex color"""
         if color.startswith('#'):
             rgb = tuple(int(color[i:i+2], 16) for i in (1, 3, 5))
@@ -55,10 +148,14 @@ class HoverButton(tk.Button):
 
 class PlaylistItem(tk.Frame):
     """Custom playlist item widget with icon and name"""
+    # Shared by the frame and both labels; bound once for all items
+    BINDTAG = 'PlaylistItem'
+    
     def __init__(self, master, playlist_name, icon, is_selected=False, command=None, **kwargs):
         # Extract bg from kwargs to avoid passing it twice
         bg_color = kwargs.pop('bg', '#1a1a1a')
-        super().__init__(master, bg=bg_color, **kwargs)
+        # The Tk class doubles as the shared bindtag and the option database name
+        super().__init__(master, bg=bg_color, class_=self.BINDTAG, **kwargs)
         
         self.playlist_name = playlist_name
         self.icon = icon
@@ -98,39 +195,280 @@ class PlaylistItem(tk.Frame):
             self.select()
     
     def bind_events(self):
-        for widget in [self, self.icon_label, self.name_label]:
-            widget.bind('<Enter>', self.on_enter)
-            widget.bind('<Leave>', self.on_leave)
-            widget.bind('<Button-1>', self.on_click)
-            widget.config(cursor='hand2')
+        if not self.bind_class(self.BINDTAG):
+            self.bind_class(self.BINDTAG, '<Enter>', lambda e: PlaylistItem.item_for(e.widget).on_enter(e))
+            self.bind_class(self.BINDTAG, '<Leave>', lambda e: PlaylistItem.item_for(e.widget).on_leave(e))
+            self.bind_class(self.BINDTAG, '<Button-1>', lambda e: PlaylistItem.item_for(e.widget).on_click(e))
+        
+        # The frame already carries the tag as its Tk class
+        for widget in [self.icon_label, self.name_label]:
+            widget.bindtags((self.BINDTAG,) + widget.bindtags())
+    
+    @staticmethod
+    def item_for(widget):
+        """Return the PlaylistItem that owns widget (the item itself or one of its labels)"""
+        return widget if isinstance(widget, PlaylistItem) else widget.master
     
     def on_enter(self, event):
         if not self.is_selected:
-            self.config(bg=self.hover_color)
-            self.icon_label.config(bg=self.hover_color)
-            self.name_label.config(bg=self.hover_color)
+            self.set_bg(self.hover_color)
     
     def on_leave(self, event):
         if not self.is_selected:
-            self.config(bg=self.bg_color)
-            self.icon_label.config(bg=self.bg_color)
-            self.name_label.config(bg=self.bg_color)
+            self.set_bg(self.bg_color)
     
     def on_click(self, event):
         if self.command:
             self.command()
     
+    def set_bg(self, color):
+        """Recolor the frame and both labels in a single Tcl call"""
+        self.tk.eval(
+            f"{self._w} configure -bg {color}; "
+            f"{self.icon_label._w} configure -bg {color}; "
+            f"{self.name_label._w} configure -bg {color}"
+        )
+    
     def select(self):
         self.is_selected = True
-        self.config(bg=self.selected_color)
-        self.icon_label.config(bg=self.selected_color)
-        self.name_label.config(bg=self.selected_color)
+        self.set_bg(self.selected_color)
     
     def deselect(self):
         self.is_selected = False
-        self.config(bg=self.bg_color)
-        self.icon_label.config(bg=self.bg_color)
-        self.name_label.config(bg=self.bg_color)
+        self.set_bg(self.bg_color)
+
+class VirtualListbox(tk.Canvas):
+    """Listbox-like song view that only draws the rows currently on screen"""
+    def __init__(self, master, row_text, font=("Segoe UI", 12), fg='#ffffff',
+                 selectbackground='#1DB954', selectforeground='#ffffff',
+                 yscrollcommand=None, **kwargs):
+        super().__init__(master, **kwargs)
+        
+        self.row_text = row_text  # Callback: model item -> displayed text
+        self.row_font = tkfont.Font(root=self, font=font)
+        self.row_height = self.row_font.metrics('linespace')
+        self.bg_color = kwargs.get('bg', '#1a1a1a')
+        self.fg_color = fg
+        self.select_bg = selectbackground
+        self.select_fg = selectforeground
+        self.scroll_command = yscrollcommand
+        
+        self.model = []  # Backing list; rows are rendered from it on demand
+        self.top_index = 0
+        self.selected_index = None
+        self.selected_item = None  # Model item at selected_index when it was selected
+        
+        # The whole view is three canvas items, reused on every redraw
+        self.rows_text = self.create_text(4, 0, anchor='nw', font=self.row_font, fill=self.fg_color)
+        self.select_rect = self.create_rectangle(0, 0, 0, 0, width=0, fill=self.select_bg, state='hidden')
+        self.select_text = self.create_text(4, 0, anchor='nw', font=self.row_font,
+                                            fill=self.select_fg, state='hidden')
+        
+        self.bind('<Configure>', lambda e: self.refresh())
+        self.bind('<Button-1>', self.on_click)
+        self.bind('<MouseWheel>', self.on_mousewheel)
+        self.bind('<Button-4>', lambda e: self.yview_scroll(-3, 'units'))
+        self.bind('<Button-5>', lambda e: self.yview_scroll(3, 'units'))
+    
+    def set_model(self, items):
+        """Show a backing list; a new list starts scrolled to the top with nothing selected"""
+        if items is not self.model:
+            self.model = items
+            self.top_index = 0
+            self.selected_index = None
+        elif self.selected_index is not None:
+            # Same list after an edit: follow the selected item if a row above it went away,
+            # drop the selection if the item itself did
+            index = self.selected_index
+            if index < len(items) and items[index] == self.selected_item:
+                pass
+            elif 0 < index <= len(items) and items[index - 1] == self.selected_item:
+                self.selected_index = index - 1
+            else:
+                self.selected_index = None
+        self.refresh()
+    
+    def page_rows(self):
+        """Number of rows that fit completely in the view"""
+        return max(1, self.winfo_height() // self.row_height)
+    
+    def refresh(self):
+        """Redraw the visible window of rows"""
+        size = len(self.model)
+        page = self.page_rows()
+        self.top_index = self._clamp_top(self.top_index)
+        
+        # All visible rows go out as one multi-line text item (one Tcl call, not one per row);
+        # one extra row covers the partially visible bottom line
+        last = min(size, self.top_index + page + 1)
+        texts = [self.row_text(item).replace('\n', ' ') for item in self.model[self.top_index:last]]
+        self.itemconfigure(self.rows_text, text='\n'.join(texts))
+        
+        # Selection highlight is drawn over the text with its own copy of the row
+        index = self.selected_index
+        if index is not None and self.top_index <= index < last:
+            y = (index - self.top_index) * self.row_height
+            self.coords(self.select_rect, 0, y, self.winfo_width(), y + self.row_height)
+            self.coords(self.select_text, 4, y)
+            self.itemconfigure(self.select_rect, state='normal')
+            self.itemconfigure(self.select_text, text=texts[index - self.top_index], state='normal')
+        else:
+            self.itemconfigure(self.select_rect, state='hidden')
+            self.itemconfigure(self.select_text, state='hidden')
+        
+        if self.scroll_command:
+            self.scroll_command(*self.yview())
+    
+    def _clamp_top(self, index):
+        return max(0, min(index, len(self.model) - self.page_rows()))
+    
+    def yview(self, *args):
+        """Scrollbar protocol: report the visible fraction or scroll the view"""
+        size = len(self.model)
+        if not args:
+            if size == 0:
+                return (0.0, 1.0)
+            return (self.top_index / size, min(1.0, (self.top_index + self.page_rows()) / size))
+        
+        top = self.top_index
+        if args[0] == 'moveto':
+            top = int(float(args[1]) * size)
+        elif args[0] == 'scroll':
+            amount = int(args[1])
+            if args[2] == 'pages':
+                amount *= max(1, self.page_rows() - 1)
+            top += amount
+        
+        # Scrollbar drags report sub-row moves and the wheel keeps firing at either end;
+        # only redraw when the first visible row actually changes
+        top = self._clamp_top(top)
+        if top != self.top_index:
+            self.top_index = top
+            self.refresh()
+    
+    def yview_moveto(self, fraction):
+        self.yview('moveto', fraction)
+    
+    def yview_scroll(self, number, what):
+        self.yview('scroll', number, what)
+    
+    def on_mousewheel(self, event):
+        self.yview_scroll(-3 if event.delta > 0 else 3, 'units')
+    
+    def on_click(self, event):
+        index = self.nearest(event.y)
+        if index >= 0:
+            self.selection_set(index)
+    
+    def nearest(self, y):
+        """Return the index of the row closest to the y coordinate"""
+        if not self.model:
+            return -1
+        return min(len(self.model) - 1, self.top_index + max(0, int(y)) // self.row_height)
+    
+    def size(self):
+        return len(self.model)
+    
+    def curselection(self):
+        if self.selected_index is not None and self.selected_index < len(self.model):
+            return (self.selected_index,)
+        return ()
+    
+    def selection_clear(self, first=0, last=None):
+        self.selected_index = None
+        self.refresh()
+    
+    def selection_set(self, index):
+        self.selected_index = index
+        self.selected_item = self.model[index] if 0 <= index < len(self.model) else None
+        self.refresh()
+    
+    def see(self, index):
+        """Scroll so that the row at index is visible"""
+        page = self.page_rows()
+        if index < self.top_index:
+            self.top_index = index
+        elif index >= self.top_index + page:
+            self.top_index = index - page + 1
+        self.refresh()
+
+class PlaylistStore(MutableMapping):
+    """Playlists saved in sqlite; a playlist's songs are only read when it is first used
+    
+    Edits happen on the in-memory lists and are written back by flush().
+    Names listed in `volatile` behave like the others but are never saved.
+    """
+    def __init__(self, db_path, volatile=()):
+        self.db = sqlite3.connect(db_path, check_same_thread=False)
+        with self.db:
+            self.db.execute("CREATE TABLE IF NOT EXISTS playlists (name TEXT PRIMARY KEY, position INTEGER)")
+            self.db.execute("CREATE TABLE IF NOT EXISTS playlist_items (playlist TEXT, position INTEGER, path TEXT)")
+            self.db.execute("CREATE INDEX IF NOT EXISTS playlist_items_by_playlist ON playlist_items (playlist, position)")
+        
+        self.volatile = set(volatile)
+        # Only the names are read at startup
+        self.names = [row[0] for row in self.db.execute("SELECT name FROM playlists ORDER BY position")]
+        self.loaded = {}  # {name: [file_paths]} for playlists read or created this session
+        self.deleted = set()
+    
+    def __getitem__(self, name):
+        items = self.loaded.get(name)
+        if items is None:
+            if name not in self.names:
+                raise KeyError(name)
+            rows = self.db.execute(
+                "SELECT path FROM playlist_items WHERE playlist=? ORDER BY position", (name,)
+            )
+            items = [_canonical_path(row[0]) for row in rows]
+            self.loaded[name] = items
+        return items
+    
+    def __setitem__(self, name, items):
+        if name not in self.names:
+            self.names.append(name)
+        self.loaded[name] = items
+        self.deleted.discard(name)
+    
+    def __delitem__(self, name):
+        if name not in self.names:
+            raise KeyError(name)
+        self.names.remove(name)
+        self.loaded.pop(name, None)
+        self.deleted.add(name)
+    
+    def __contains__(self, name):
+        # Mapping's default would load the playlist just to test the name
+        return name in self.names
+    
+    def __iter__(self):
+        return iter(list(self.names))
+    
+    def __len__(self):
+        return len(self.names)
+    
+    def flush(self):
+        """Write playlist names and every loaded playlist back to the database"""
+        with self.db:
+            for name in self.deleted:
+                self.db.execute("DELETE FROM playlist_items WHERE playlist=?", (name,))
+            self.deleted.clear()
+            
+            self.db.execute("DELETE FROM playlists")
+            self.db.executemany(
+                "INSERT INTO playlists (name, position) VALUES (?, ?)",
+                [(name, i) for i, name in enumerate(self.names) if name not in self.volatile]
+            )
+            for name, items in self.loaded.items():
+                if name in self.volatile:
+                    continue
+                self.db.execute("DELETE FROM playlist_items WHERE playlist=?", (name,))
+                self.db.executemany(
+                    "INSERT INTO playlist_items (playlist, position, path) VALUES (?, ?, ?)",
+                    [(name, i, path) for i, path in enumerate(items)]
+                )
+    
+    def close(self):
+        self.db.close()
 
 class MusicPlayer:
     def __init__(self, root):
@@ -155,19 +493,28 @@ class MusicPlayer:
             'selected': '#2a2a2a'
         }
         
-        # Audio backend: prefer VLC (better codec support on Windows), fallback to pygame
+        # Audio backend: prefer VLC (better codec support on Windows), fallback to pygame.
+        # VLC scans its plugins on startup, so it is created on a worker thread while the
+        # window comes up; a play request made before it is ready waits in _pending_play.
         self._use_vlc = vlc is not None
         self._vlc_instance = None
         self._vlc_player = None
+        self._vlc_ready = threading.Event()
+        self._vlc_init_result = None  # (instance, player) from the worker, None on failure
+        self._pending_play = None
+        self._pending_paused = False  # Pause pressed while a song waits in _pending_play
+        self._vlc_play_token = 0  # Bumped per VLC play/stop so stale media starts are dropped
+        # Media starts and end-of-song reports from worker/VLC threads, drained on the Tk thread
+        self._vlc_events = queue.Queue()
+        self._vlc_starts_pending = 0  # Media builds whose result hasn't been drained yet
+        self._vlc_drain_pending = False
+        self._duration_cache = {}  # {(path, mtime): seconds} for the pygame backend
+        self._current_duration_key = None  # Cache key of the song loaded into pygame
+        self._meta_pool = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="meta")
 
         if self._use_vlc:
-            try:
-                self._vlc_instance = vlc.Instance()
-                self._vlc_player = self._vlc_instance.media_player_new()
-            except Exception:
-                self._use_vlc = False
-                self._vlc_instance = None
-                self._vlc_player = None
+            threading.Thread(target=self._init_vlc_backend, daemon=True).start()
+            self.root.after(50, self._poll_vlc_backend)
 
         # Initialize pygame mixer with proper settings (fallback backend)
         try:
@@ -189,19 +536,76 @@ class MusicPlayer:
         
         # Player state
         self.all_songs = []  # All songs in library
+        self._all_songs_set = set()  # Same paths as all_songs / playlists["All"], for O(1) lookups
         self.favourites = []  # Favourite songs
-        self.playlists = {}  # Custom playlists: {name: [file_paths]}
+        self.playlists = self.open_playlist_store()  # Playlists: {name: [file_paths]}, saved on close
         self.current_playlist_name = "All"  # Currently selected playlist
-        self.current_playlist = []  # Songs in current playlist view (starts as all_songs)
+        self._playlist_version = 0  # Bumped on every switch; stale chunk work checks it
+        self.current_playlist = []  # The list behind the current view (not a copy)
         self.current_index = 0
+        self._playing_path = None  # Song whose title the now-playing label shows
         self.is_playing = False
         self.is_paused = False
         self.volume = 0.7
+        self._pending_volume = self.volume  # Latest slider value, applied by _flush_volume
+        self._vol_after_id = None
+        self._last_progress_int = -1  # Last values written to the progress widgets
+        self._last_time_secs = None  # (position, duration) in whole seconds
+        self._progress_after_id = None  # Pending update_progress timer
+        self._song_ended = False  # Set once the current song has been handled as finished
+        self._exists_cache = {}  # {path: (checked_at, (path, mtime) or None if missing)}, see _file_key
         self._backend_set_volume(self.volume)
         
-        # Initialize default playlists
+        # Initialize default playlists ("Favourite" may already be saved)
         self.playlists["All"] = []
-        self.playlists["Favourite"] = []
+        self.playlists.setdefault("Favourite", [])
+        self.favourites = self.playlists["Favourite"]  # Same list, so edits happen once
+        
+        # Membership sets next to the ordered lists, for O(1) "is it in there" checks.
+        # Custom playlists get theirs on first use; "Favourite" shares _favourites_set.
+        self._favourites_set = set(self.favourites)
+        self._playlist_sets = {"Favourite": self._favourites_set}
+        # Reverse index over the custom playlists, {path: {names}}; built on the first song menu
+        self._song_to_playlists = None
+        
+        # Title cache persisted between runs
+        self._meta_cache = self.load_meta_cache()
+        self._meta_cache_dirty = False
+        self._title_cache = {}  # Titles resolved this session: {path: title}
+        self._title_pool = concurrent.futures.ThreadPoolExecutor(max_workers=os.cpu_count())
+        self._prewarm_inflight = set()  # Paths queued on _title_pool and not yet resolved
+        # The selected playlist is warmed on a pool of its own, ahead of the library backlog;
+        # its queued lookups are cancelled when another playlist is selected
+        self._playlist_title_pool = concurrent.futures.ThreadPoolExecutor(max_workers=2)
+        self._playlist_inflight = set()
+        self._playlist_futures = []
+        # 'lazy': rows show the filename title first and tags are read in the background;
+        # 'eager': rows wait for the tags
+        self._metadata_mode = 'lazy'
+        # Rows on screen get their own pool so they don't queue behind the prewarm backlog
+        self._row_title_pool = concurrent.futures.ThreadPoolExecutor(max_workers=2)
+        self._pending_titles = {}  # {path: future} for lazy row lookups
+        self._title_poll_pending = False
+        self._closing = False
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
+        
+        # Background folder scans: workers push (scan_id, paths) batches here
+        self._scan_queue = queue.Queue()
+        self._scans = {}
+        self._scan_id = 0
+        self._scan_drain_pending = False
+        self._list_refresh_pending = False
+        
+        # Hand cursor defaults come from the option database instead of per-widget configure
+        # (every tk.Button in the player is a HoverButton)
+        self.root.option_add("*Button.cursor", "hand2")
+        self.root.option_add("*PlaylistItem*cursor", "hand2")
+        
+        # Context menus, created on first use and reused afterwards
+        self._song_ctx_menu = None
+        self._playlist_submenu = None
+        self._playlist_ctx_menu = None
+        self._toast_after_id = None  # Pending clear of the status label
         
         # Configure styles
         self.configure_styles()
@@ -213,11 +617,8 @@ class MusicPlayer:
         self.auto_load_songs_folder()
         
         # Initialize current playlist to "All"
-        self.current_playlist = self.all_songs.copy()
+        self.current_playlist = self.all_songs
         self.update_song_list_display()
-        
-        # Start progress update thread
-        self.update_progress()
     
     def configure_styles(self):
         """Configure ttk styles for professional look"""
@@ -328,14 +729,17 @@ class MusicPlayer:
         
         # Store playlist items
         self.playlist_items = {}
-        
-        # Bind right-click on playlist items
-        self.playlists_container.bind('<Button-3>', self.show_playlist_context_menu)
+        self._sidebar_dirty = False  # Scroll region refresh already scheduled
         
         # Add default playlists
         self.add_playlist_item("All", "📀", True)
         self.add_playlist_item("Favourite", "❤️", False)
         
+        # Saved custom playlists (contents are loaded when first opened)
+        for name in self.playlists:
+            if name not in _RESERVED:
+                self.add_playlist_item(name, "📋", False)
+        
         # File operations at bottom of sidebar
         file_ops_frame = tk.Frame(sidebar, bg=self.colors['sidebar'])
         file_ops_frame.pack(fill=tk.X, padx=15, pady=15)
@@ -383,11 +787,18 @@ class MusicPlayer:
         item.pack(fill=tk.X, padx=0, pady=2)
         self.playlist_items[name] = item
         
-        # Bind right-click to item
+        # Bind right-click to item; the name travels with the binding
         for widget in [item, item.icon_label, item.name_label]:
-            widget.bind('<Button-3>', lambda e, n=name: self.show_playlist_context_menu(e, n))
+            widget.bind('<Button-3>', lambda e, n=name: self.show_playlist_context_menu(e, playlist_name=n))
         
-        # Update canvas scroll region
+        # Update canvas scroll region once, after any burst of additions
+        if not self._sidebar_dirty:
+            self._sidebar_dirty = True
+            self.root.after_idle(self._refresh_sidebar_scroll)
+    
+    def _refresh_sidebar_scroll(self):
+        """Recompute the sidebar scroll region after playlist items were added"""
+        self._sidebar_dirty = False
         self.playlists_canvas.update_idletasks()
         self.playlists_canvas.configure(scrollregion=self.playlists_canvas.bbox("all"))
     
@@ -401,17 +812,39 @@ class MusicPlayer:
         if playlist_name in self.playlist_items:
             self.playlist_items[playlist_name].select()
         
-        # Update current playlist
+        # Update current playlist (the view shares the playlist's list, no copy)
         self.current_playlist_name = playlist_name
         if playlist_name == "All":
-            self.current_playlist = self.all_songs.copy()
+            self.current_playlist = self.all_songs
         elif playlist_name == "Favourite":
-            self.current_playlist = self.favourites.copy()
+            self.current_playlist = self.favourites
         else:
-            self.current_playlist = self.playlists.get(playlist_name, []).copy()
+            self.current_playlist = self.playlists.get(playlist_name, [])
         
         # Update song list display
         self.update_song_list_display()
+        
+        # Resolve the rest of the playlist's titles in chunks, top rows first
+        for future in self._playlist_futures:
+            future.cancel()
+        self._playlist_futures = []
+        self._playlist_inflight.clear()
+        self._playlist_version += 1
+        self.root.after_idle(self._warm_playlist_chunk, self._playlist_version, 0)
+    
+    def _warm_playlist_chunk(self, version, start):
+        """Queue title lookups for one chunk of the shown playlist, then schedule the next"""
+        if version != self._playlist_version:
+            return  # Another playlist was selected since
+        end = start + PLAYLIST_CHUNK_SIZE
+        for file_path in self.current_playlist[start:end]:
+            if file_path not in self._title_cache and file_path not in self._playlist_inflight:
+                self._playlist_inflight.add(file_path)
+                self._playlist_futures.append(
+                    self._playlist_title_pool.submit(self._prewarm_title, file_path, self._playlist_inflight)
+                )
+        if end < len(self.current_playlist):
+            self.root.after_idle(self._warm_playlist_chunk, version, end)
     
     def create_song_list(self, parent):
         """Create main song list area"""
@@ -439,6 +872,16 @@ class MusicPlayer:
         song_count_label.pack(side=tk.LEFT, padx=(15, 0))
         self.song_count_label = song_count_label
         
+        # Folder scan progress
+        self.scan_status_label = tk.Label(
+            header_frame,
+            text="",
+            font=("Segoe UI", 11),
+            bg=self.colors['bg'],
+            fg=self.colors['text_secondary']
+        )
+        self.scan_status_label.pack(side=tk.RIGHT)
+        
         # Song list container
         list_container = tk.Frame(parent, bg=self.colors['bg_secondary'])
         list_container.pack(fill=tk.BOTH, expand=True, padx=20, pady=(0, 20))
@@ -447,9 +890,10 @@ class MusicPlayer:
         scrollbar = tk.Scrollbar(list_container, bg=self.colors['bg_tertiary'], troughcolor=self.colors['bg_secondary'])
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         
-        # Listbox
-        self.song_listbox = tk.Listbox(
+        # Song list (only the visible rows are rendered)
+        self.song_listbox = VirtualListbox(
             list_container,
+            row_text=self.get_song_info,
             bg=self.colors['bg_secondary'],
             fg=self.colors['text'],
             selectbackground=self.colors['accent'],
@@ -458,8 +902,7 @@ class MusicPlayer:
             yscrollcommand=scrollbar.set,
             relief=tk.FLAT,
             bd=0,
-            highlightthickness=0,
-            activestyle='none'
+            highlightthickness=0
         )
         self.song_listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=2, pady=2)
         scrollbar.config(command=self.song_listbox.yview)
@@ -623,6 +1066,17 @@ class MusicPlayer:
             width=4
         )
         self.volume_value_label.pack(side=tk.LEFT)
+        
+        # Status line for short confirmations (see _toast)
+        self.status_label = tk.Label(
+            player_frame,
+            text="",
+            font=("Segoe UI", 10),
+            bg=self.colors['bg_secondary'],
+            fg=self.colors['text_secondary'],
+            anchor='w'
+        )
+        self.status_label.pack(side=tk.LEFT, padx=30, pady=(0, 15))
     
     def create_playlist(self):
         """Create a new playlist"""
@@ -634,8 +1088,9 @@ class MusicPlayer:
                 return
             
             self.playlists[name] = []
+            self._playlist_sets[name] = set()
             self.add_playlist_item(name, "📋", False)
-            messagebox.showinfo("Success", f"Playlist '{name}' created!")
+            self._toast(f"Playlist '{name}' created!")
     
     def add_file(self):
         """Add a single audio file to library"""
@@ -652,14 +1107,15 @@ class MusicPlayer:
             ]
         )
         if file_path:
-            if file_path not in self.all_songs:
+            file_path = _canonical_path(file_path)
+            if file_path not in self._all_songs_set:
                 self.all_songs.append(file_path)
+                self._all_songs_set.add(file_path)
                 self.playlists["All"].append(file_path)
                 
                 # Update display if "All" is selected
                 if self.current_playlist_name == "All":
-                    self.current_playlist.append(file_path)
-                    self.update_song_list_display()
+                    self._schedule_list_refresh()
                 
                 self.update_song_count()
     
@@ -671,64 +1127,114 @@ class MusicPlayer:
         
         # Check if songs folder exists
         if os.path.exists(songs_folder) and os.path.isdir(songs_folder):
-            audio_extensions = {'.mp3', '.wav', '.ogg', '.flac', '.m4a'}
-            added_count = 0
-            
-            # Scan the songs folder recursively
-            for root, dirs, files in os.walk(songs_folder):
-                for file in files:
-                    if Path(file).suffix.lower() in audio_extensions:
-                        file_path = os.path.join(root, file)
-                        if file_path not in self.all_songs:
-                            self.all_songs.append(file_path)
-                            self.playlists["All"].append(file_path)
-                            added_count += 1
+            def on_done(added_count):
+                if added_count > 0:
+                    print(f"Auto-loaded {added_count} song(s) from 'songs' folder")
             
-            # Update display if songs were found
-            if added_count > 0:
-                if self.current_playlist_name == "All":
-                    self.current_playlist = self.all_songs.copy()
-                    self.update_song_list_display()
-                self.update_song_count()
-                print(f"Auto-loaded {added_count} song(s) from 'songs' folder")
+            self.start_folder_scan(songs_folder, on_done)
     
     def add_folder(self):
         """Add all audio files from a folder to library"""
         folder_path = filedialog.askdirectory(title="Select Folder")
         if folder_path:
-            audio_extensions = {'.mp3', '.wav', '.ogg', '.flac', '.m4a'}
-            added_count = 0
-            for root, dirs, files in os.walk(folder_path):
-                for file in files:
-                    if Path(file).suffix.lower() in audio_extensions:
-                        file_path = os.path.join(root, file)
-                        if file_path not in self.all_songs:
-                            self.all_songs.append(file_path)
-                            self.playlists["All"].append(file_path)
-                            added_count += 1
+            def on_done(added_count):
+                if added_count > 0:
+                    self._toast(f"Added {added_count} song(s) to library")
+                else:
+                    messagebox.showwarning("Warning", "No audio files found in the selected folder")
             
-            if added_count > 0:
-                # Update display if "All" is selected
-                if self.current_playlist_name == "All":
-                    self.current_playlist = self.all_songs.copy()
-                    self.update_song_list_display()
-                
-                self.update_song_count()
-                messagebox.showinfo("Success", f"Added {added_count} song(s) to library")
-            else:
-                messagebox.showwarning("Warning", "No audio files found in the selected folder")
+            self.start_folder_scan(folder_path, on_done)
+    
+    def start_folder_scan(self, folder_path, on_done):
+        """Scan a folder for audio files on a worker thread"""
+        self._scan_id += 1
+        scan_id = self._scan_id
+        self._scans[scan_id] = [0, on_done]  # [added_count, completion callback]
+        
+        threading.Thread(
+            target=self._scan_worker,
+            args=(folder_path, scan_id),
+            daemon=True
+        ).start()
+        
+        if not self._scan_drain_pending:
+            self._scan_drain_pending = True
+            self.root.after(100, self._drain_scan_queue)
+    
+    def _scan_worker(self, folder_path, scan_id):
+        """Walk a folder and queue audio files in batches (runs off the Tk thread)"""
+        batch = []
+        try:
+            for file_path in _iter_audio_files(folder_path):
+                # Canonical: the same path object is shared by every list, set and cache that holds it
+                batch.append(_canonical_path(file_path))
+                if len(batch) >= SCAN_BATCH_SIZE:
+                    self._scan_queue.put((scan_id, batch))
+                    batch = []
+        finally:
+            if batch:
+                self._scan_queue.put((scan_id, batch))
+            # None marks the end of this scan
+            self._scan_queue.put((scan_id, None))
+    
+    def _drain_scan_queue(self):
+        """Move scanned files from the worker queue into the library"""
+        new_songs = []
+        finished = []
+        while True:
+            try:
+                scan_id, batch = self._scan_queue.get_nowait()
+            except queue.Empty:
+                break
+            
+            if batch is None:
+                finished.append(scan_id)
+                continue
+            
+            for file_path in batch:
+                if file_path not in self._all_songs_set:
+                    self.all_songs.append(file_path)
+                    self._all_songs_set.add(file_path)
+                    self.playlists["All"].append(file_path)
+                    new_songs.append(file_path)
+                    self._scans[scan_id][0] += 1
+        
+        # Update display once for everything drained in this pass
+        if new_songs:
+            if self.current_playlist_name == "All":
+                self._schedule_list_refresh()
+            self.update_song_count()
+            self.prewarm_titles(new_songs)
+        
+        for scan_id in finished:
+            added_count, on_done = self._scans.pop(scan_id)
+            on_done(added_count)
+        
+        if self._scans:
+            self.scan_status_label.config(text=f"Scanning… {len(self.all_songs)} songs")
+            self.root.after(100, self._drain_scan_queue)
+        else:
+            self.scan_status_label.config(text="")
+            self._scan_drain_pending = False
     
     def update_song_list_display(self):
         """Update the song list display"""
-        self.song_listbox.delete(0, tk.END)
-        for file_path in self.current_playlist:
-            song_info = self.get_song_info(file_path)
-            self.song_listbox.insert(tk.END, song_info)
+        self.song_listbox.set_model(self.current_playlist)
         
         # Update title and count
         self.playlist_title_label.config(text=self.current_playlist_name)
         self.update_song_count()
     
+    def _schedule_list_refresh(self):
+        """Redraw the song list on the next idle turn, at most once however often it is requested"""
+        if not self._list_refresh_pending:
+            self._list_refresh_pending = True
+            self.root.after_idle(self._do_list_refresh)
+    
+    def _do_list_refresh(self):
+        self._list_refresh_pending = False
+        self.update_song_list_display()
+    
     def update_song_count(self):
         """Update song count label"""
         count = len(self.current_playlist)
@@ -744,51 +1250,145 @@ class MusicPlayer:
             self.current_index = selection[0]
             self.play_song()
     
-    def get_song_info(self, file_path):
-        """Extract song title only (no artist) from metadata or filename"""
+    def load_meta_cache(self):
+        """Load the persistent title cache from disk"""
         try:
-            audio_file = MutagenFile(file_path)
-            if audio_file is not None:
-                title = None
-                
-                # Try different tag formats for title
-                # MP3 tags (ID3v2)
-                if 'TIT2' in audio_file:
-                    title = str(audio_file['TIT2'][0]).strip()
-                elif 'TITLE' in audio_file:
-                    title = str(audio_file['TITLE'][0]).strip()
-                elif hasattr(audio_file, 'get'):
-                    if audio_file.get('TITLE'):
-                        title = str(audio_file.get('TITLE')[0]).strip()
-                    elif audio_file.get('TIT2'):
-                        title = str(audio_file.get('TIT2')[0]).strip()
-                
-                # If we found a title, return it
-                if title and title != 'Unknown' and title != '':
-                    return title
-        except Exception:
+            with open(META_CACHE_PATH, 'r', encoding='utf-8') as f:
+                cache = json.load(f)
+            if isinstance(cache, dict):
+                return cache
+        except (OSError, ValueError):
             pass
-        
+        return {}
+    
+    def save_meta_cache(self):
+        """Write the title cache back to disk if it changed this session"""
+        if not self._meta_cache_dirty:
+            return
+        tmp_path = META_CACHE_PATH + ".tmp"
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                # Snapshot, since prewarm workers may still be adding entries
+                json.dump(dict(self._meta_cache), f)
+            os.replace(tmp_path, META_CACHE_PATH)
+            self._meta_cache_dirty = False
+        except OSError as e:
+            print(f"Could not save metadata cache: {e}")
+    
+    def open_playlist_store(self):
+        """Open the saved playlists, falling back to an unsaved in-memory store"""
+        try:
+            return PlaylistStore(PLAYLIST_DB_PATH, volatile=["All"])
+        except sqlite3.Error as e:
+            print(f"Could not open playlist database: {e}")
+            return PlaylistStore(":memory:", volatile=["All"])
+    
+    def on_close(self):
+        """Flush caches and close the window"""
+        # Queued prewarm tasks see the flag and return without parsing
+        self._closing = True
+        self._title_pool.shutdown(wait=False)
+        self._row_title_pool.shutdown(wait=False)
+        self._playlist_title_pool.shutdown(wait=False)
+        self._meta_pool.shutdown(wait=False)
+        self.save_meta_cache()
+        try:
+            self.playlists.flush()
+            self.playlists.close()
+        except sqlite3.Error as e:
+            print(f"Could not save playlists: {e}")
+        self.root.destroy()
+    
+    def get_song_info(self, file_path):
+        """Extract song title only (no artist) from metadata or filename
+        
+        In 'lazy' metadata mode an unresolved title is returned from the filename
+        right away and upgraded in the background.
+        """
+        title = self._title_cache.get(file_path)
+        if title is not None:
+            return title
+        if self._metadata_mode != 'lazy':
+            return self.resolve_song_title(file_path)
+        
+        if file_path not in self._pending_titles:
+            self._pending_titles[file_path] = self._row_title_pool.submit(self._prewarm_title, file_path)
+            if not self._title_poll_pending:
+                self._title_poll_pending = True
+                self.root.after(100, self._poll_title_updates)
+        return self.get_title_from_filename(file_path)
+    
+    def _poll_title_updates(self):
+        """Redraw the song list once background title lookups finish"""
+        done = [path for path, future in self._pending_titles.items() if future.done()]
+        if done:
+            for path in done:
+                del self._pending_titles[path]
+            self.song_listbox.refresh()
+            if self._playing_path in done:
+                self.current_song_label.config(text=self._title_cache.get(self._playing_path) or "Unknown Song")
+        
+        if self._pending_titles:
+            self.root.after(100, self._poll_title_updates)
+        else:
+            self._title_poll_pending = False
+    
+    def resolve_song_title(self, file_path):
+        """Look up a title via the disk cache or the file's tags (safe to call from worker threads)"""
+        try:
+            st = os.stat(file_path)
+        except OSError:
+            title = self.get_title_from_filename(file_path)
+            self._title_cache[file_path] = title
+            return title
+        
+        # Reuse the cached title while the file is unchanged
+        cached = self._meta_cache.get(file_path)
+        if cached and cached[0] == st.st_mtime and cached[1] == st.st_size:
+            title = cached[2]
+        else:
+            title = _read_song_title(file_path, st.st_mtime, st.st_size)
+            if not title:
+                title = self.get_title_from_filename(file_path)
+            self._meta_cache[file_path] = [st.st_mtime, st.st_size, title]
+            self._meta_cache_dirty = True
+        
+        self._title_cache[file_path] = title
+        return title
+    
+    def prewarm_titles(self, file_paths):
+        """Resolve titles in the background so the list never waits on tag parsing"""
+        for file_path in file_paths:
+            if file_path not in self._title_cache and file_path not in self._prewarm_inflight:
+                self._prewarm_inflight.add(file_path)
+                self._title_pool.submit(self._prewarm_title, file_path, self._prewarm_inflight)
+    
+    def _prewarm_title(self, file_path, inflight=None):
+        try:
+            if not self._closing and file_path not in self._title_cache:
+                self.resolve_song_title(file_path)
+        finally:
+            # After the title is cached, so a caller that sees the path gone also sees the title
+            if inflight is not None:
+                inflight.discard(file_path)
+    
+    def get_title_from_filename(self, file_path):
+        """Derive a song title from the file name"""
         # Fallback: extract song name from filename
         filename = os.path.basename(file_path)
         # Remove extension
         song_name = os.path.splitext(filename)[0]
         
         # Clean up common patterns: "Artist - Title" -> "Title"
-        # Remove common separators and artist patterns
-        separators = [' - ', ' – ', ' — ', '-', '_']
-        for sep in separators:
-            if sep in song_name:
-                parts = song_name.split(sep)
-                # Usually the last part is the title, but check if it's longer
-                if len(parts) > 1:
-                    # Take the last part as title (most common format)
-                    song_name = parts[-1].strip()
-                    break
+        # Take the part after the last occurrence of the first separator found
+        for sep in TITLE_SEPARATORS:
+            head, found, tail = song_name.rpartition(sep)
+            if found:
+                song_name = tail.strip()
+                break
         
         # Remove common prefixes like track numbers "01. Song Name" -> "Song Name"
-        import re
-        song_name = re.sub(r'^\d+[.\s\-_]+', '', song_name, count=1)
+        song_name = _LEAD_NUM_RE.sub('', song_name, count=1)
         song_name = song_name.strip()
         
         return song_name if song_name else "Unknown Song"
@@ -806,7 +1406,7 @@ class MusicPlayer:
             file_path = self.current_playlist[self.current_index]
             
             # Check if file exists
-            if not os.path.exists(file_path):
+            if not self._exists(file_path):
                 messagebox.showerror("Error", f"File not found:\n{file_path}")
                 return
 
@@ -820,9 +1420,12 @@ class MusicPlayer:
 
             self.is_playing = True
             self.is_paused = False
+            self._song_ended = False
             self.play_btn.config(text="⏸")
             
-            # Update current song label
+            # Update current song label; an unresolved title shows the filename until
+            # _poll_title_updates has the tag
+            self._playing_path = file_path
             song_info = self.get_song_info(file_path)
             if not song_info or song_info.strip() == "":
                 song_info = os.path.basename(file_path)
@@ -831,19 +1434,20 @@ class MusicPlayer:
             if not song_info:
                 song_info = "Unknown Song"
             
-            # Update label with proper text
+            # Update label with proper text (Tk repaints it on the next idle turn)
             self.current_song_label.config(text=song_info)
-            # Force immediate GUI update
-            self.current_song_label.update_idletasks()
-            self.root.update_idletasks()
             
             # Highlight current song in list
             self.song_listbox.selection_clear(0, tk.END)
             self.song_listbox.selection_set(self.current_index)
             self.song_listbox.see(self.current_index)
             
-            # Check for end of song
-            self.check_song_end()
+            # Progress updates (which also notice pygame reaching the end) run only while playing
+            self._start_playback_timers()
+            
+            # Warm up the next track so moving on doesn't wait on disk
+            next_path = self.current_playlist[(self.current_index + 1) % len(self.current_playlist)]
+            self._meta_pool.submit(self._prefetch, next_path)
             
         except Exception as e:
             error_msg = f"Could not play song: {str(e)}"
@@ -852,12 +1456,49 @@ class MusicPlayer:
             import traceback
             print(f"Full error traceback:\n{traceback.format_exc()}")
     
-    def check_song_end(self):
-        """Check if song has ended and play next"""
-        if self.is_playing and not pygame.mixer.music.get_busy():
-            self.next_song()
-        else:
-            self.root.after(1000, self.check_song_end)
+    def _exists(self, file_path):
+        """os.path.exists with results reused for EXISTS_CACHE_TTL seconds"""
+        return self._file_key(file_path) is not None
+    
+    def _file_key(self, file_path):
+        """(path, mtime) of file_path, or None if it can't be found; reused for EXISTS_CACHE_TTL seconds"""
+        cached = self._exists_cache.get(file_path)
+        if cached and time.monotonic() - cached[0] < EXISTS_CACHE_TTL:
+            return cached[1]
+        try:
+            key = (file_path, os.stat(file_path).st_mtime)
+        except FileNotFoundError:
+            key = None
+        except OSError:
+            return None  # Maybe transient (permissions, network share), so not remembered
+        self._remember_file_key(file_path, key)
+        return key
+    
+    def _remember_file_key(self, file_path, key):
+        """Record a stat result for _file_key (called from the Tk thread and the metadata worker)"""
+        now = time.monotonic()
+        if len(self._exists_cache) >= EXISTS_CACHE_PRUNE_SIZE:
+            # Snapshot first: the other thread may be adding an entry meanwhile
+            for path, (checked_at, _) in list(self._exists_cache.items()):
+                if now - checked_at >= EXISTS_CACHE_TTL:
+                    self._exists_cache.pop(path, None)
+        self._exists_cache[file_path] = (now, key)
+    
+    def _on_song_end(self):
+        """Single reaction to a song finishing, whichever backend noticed it"""
+        if self._song_ended or not self.is_playing:
+            return
+        self._song_ended = True
+        self.next_song()
+    
+    def _start_playback_timers(self):
+        self._cancel_playback_timers()
+        self._progress_after_id = self.root.after(300, self.update_progress)
+    
+    def _cancel_playback_timers(self):
+        if self._progress_after_id is not None:
+            self.root.after_cancel(self._progress_after_id)
+            self._progress_after_id = None
     
     def toggle_play_pause(self):
         """Toggle between play and pause"""
@@ -871,6 +1512,7 @@ class MusicPlayer:
                 self.is_playing = True
                 self.is_paused = False
                 self.play_btn.config(text="⏸")
+                self._start_playback_timers()
             else:
                 self.play_song()
         else:
@@ -878,15 +1520,19 @@ class MusicPlayer:
             self.is_playing = False
             self.is_paused = True
             self.play_btn.config(text="▶")
+            self._cancel_playback_timers()
     
     def stop_song(self):
         """Stop the current song"""
         self._backend_stop()
+        self._cancel_playback_timers()
         self.is_playing = False
         self.is_paused = False
         self.play_btn.config(text="▶")
         self.progress_var.set(0)
         self.time_label.config(text="00:00 / 00:00")
+        self._last_progress_int = 0
+        self._last_time_secs = (0, 0)
     
     def next_song(self):
         """Play next song in playlist"""
@@ -905,28 +1551,52 @@ class MusicPlayer:
         self.play_song()
     
     def set_volume(self, value):
-        """Set volume level"""
-        self.volume = float(value) / 100.0
+        """Set volume level (slider drags are applied at most every 30 ms)"""
+        self._pending_volume = float(value) / 100.0
+        if self._vol_after_id is None:
+            self._vol_after_id = self.root.after(30, self._flush_volume)
+    
+    def _flush_volume(self):
+        """Apply the latest slider value to the backend"""
+        self._vol_after_id = None
+        self.volume = self._pending_volume
         self._backend_set_volume(self.volume)
         self.volume_value_label.config(text=f"{int(self.volume * 100)}%")
     
     def update_progress(self):
-        """Update progress bar and time display"""
-        if self.is_playing and self._backend_is_busy():
-            try:
-                current_pos = self._backend_get_pos_seconds()
-                duration = self._backend_get_duration_seconds()
-                if duration and duration > 0:
-                    progress = (current_pos / duration) * 100
-                    self.progress_var.set(min(progress, 100))
-
-                    current_time = self.format_time(current_pos)
-                    total_time = self.format_time(duration)
-                    self.time_label.config(text=f"{current_time} / {total_time}")
-            except:
-                pass
+        """Update progress bar and time display (scheduled only while a song is playing)"""
+        self._progress_after_id = None
+        if not self.is_playing:
+            return
+        
+        if self._use_vlc:
+            self._handle_vlc_events()
+            if self._progress_after_id is not None or not self.is_playing:
+                return  # The song ended and the next one (if any) started its own timer
+        
+        if self._backend_is_busy():
+            current_pos = self._backend_get_pos_seconds()
+            duration = self._backend_get_duration_seconds()
+            if duration and duration > 0:
+                # Only touch the widgets when the displayed value changes
+                progress = int(min((current_pos / duration) * 100, 100))
+                if progress != self._last_progress_int:
+                    self._last_progress_int = progress
+                    self.progress_var.set(progress)
+                
+                time_secs = (int(current_pos), int(duration))
+                if time_secs != self._last_time_secs:
+                    self._last_time_secs = time_secs
+                    self.time_label.config(
+                        text=f"{self.format_time(time_secs[0])} / {self.format_time(time_secs[1])}"
+                    )
+        elif not self._use_vlc:
+            # pygame has no end callback without a display window; an idle mixer
+            # while we think we're playing means the song ran out (VLC reports it itself)
+            self._on_song_end()
+            return
         
-        self.root.after(100, self.update_progress)
+        self._progress_after_id = self.root.after(300, self.update_progress)
     
     def format_time(self, seconds):
         """Format seconds to MM:SS"""
@@ -937,16 +1607,104 @@ class MusicPlayer:
     # -----------------------
     # Audio backend (VLC/pygame)
     # -----------------------
+    def _init_vlc_backend(self) -> None:
+        """Create the VLC instance and player (runs off the Tk thread)"""
+        try:
+            instance = vlc.Instance()
+            self._vlc_init_result = (instance, instance.media_player_new())
+        except Exception:
+            self._vlc_init_result = None
+        finally:
+            self._vlc_ready.set()
+
+    def _poll_vlc_backend(self) -> None:
+        """Switch to VLC on the Tk thread once the worker is done and replay queued state"""
+        if not self._vlc_ready.is_set():
+            self.root.after(50, self._poll_vlc_backend)
+            return
+
+        if self._vlc_init_result:
+            self._vlc_instance, self._vlc_player = self._vlc_init_result
+            self._vlc_player.event_manager().event_attach(
+                vlc.EventType.MediaPlayerEndReached, self._on_vlc_end_reached
+            )
+        else:
+            self._use_vlc = False
+            if not pygame.mixer.get_init():
+                messagebox.showerror(
+                    "Initialization Error",
+                    "Failed to initialize audio system.\n\n"
+                    "Please make sure your audio drivers are installed and working."
+                )
+
+        self._backend_set_volume(self.volume)
+
+        # A song paused while parked stays parked until _backend_unpause
+        if self._pending_play and not self._pending_paused:
+            file_path, self._pending_play = self._pending_play, None
+            try:
+                self._backend_play(file_path)
+            except Exception as e:
+                messagebox.showerror("Error", f"Could not play song:\n{str(e)}")
+                self.stop_song()
+
+    def _on_vlc_end_reached(self, event) -> None:
+        # Called on a VLC thread, which must touch neither libvlc nor Tk; update_progress picks it up
+        self._vlc_events.put(('end', self._vlc_play_token))
+
+    def _schedule_vlc_drain(self) -> None:
+        if not self._vlc_drain_pending:
+            self._vlc_drain_pending = True
+            self.root.after(50, self._drain_vlc_events)
+
+    def _drain_vlc_events(self) -> None:
+        """Poll for built media; runs only while a media_new is outstanding"""
+        self._handle_vlc_events()
+        if self._vlc_starts_pending:
+            self.root.after(50, self._drain_vlc_events)
+        else:
+            self._vlc_drain_pending = False
+
+    def _handle_vlc_events(self) -> None:
+        """Start built media and react to song ends queued by the metadata worker and VLC.
+
+        Called from _drain_vlc_events and from the update_progress tick, which runs
+        whenever a song is playing.
+        """
+        while True:
+            try:
+                kind, token, *rest = self._vlc_events.get_nowait()
+            except queue.Empty:
+                break
+            if kind == 'start':
+                self._vlc_starts_pending -= 1
+                self._start_vlc(token, *rest)
+            elif token == self._vlc_play_token:
+                self._on_song_end()
+
+    def _backend_vlc_pending(self) -> bool:
+        return self._use_vlc and self._vlc_player is None
+
     def _backend_play(self, file_path: str) -> None:
-        file_path = os.path.normpath(file_path)
+        # Paths were normalized by _canonical_path when they entered the library
+        if self._backend_vlc_pending():
+            # Started by _poll_vlc_backend as soon as VLC is ready
+            self._pending_play = file_path
+            return
 
         if self._use_vlc and self._vlc_instance and self._vlc_player:
-            media = self._vlc_instance.media_new(file_path)
-            self._vlc_player.set_media(media)
-            self._vlc_player.play()
+            # media_new may block on disk/network: build the media on the metadata
+            # worker and start it back on the Tk thread from _drain_vlc_events
+            self._vlc_play_token += 1
+            token = self._vlc_play_token
+            future = self._meta_pool.submit(self._vlc_instance.media_new, file_path)
+            self._vlc_starts_pending += 1
+            future.add_done_callback(lambda f: self._vlc_events.put(('start', token, f)))
+            self._schedule_vlc_drain()
             return
 
         # pygame fallback
+        self._current_duration_key = self._request_duration(file_path)
         try:
             pygame.mixer.music.load(file_path)
             pygame.mixer.music.play()
@@ -963,13 +1721,34 @@ class MusicPlayer:
                 )
             raise
 
+    def _start_vlc(self, token: int, future) -> None:
+        if token != self._vlc_play_token:
+            return  # Stopped, or another song was requested meanwhile
+        try:
+            self._vlc_player.set_media(future.result())
+            self._vlc_player.play()
+        except Exception as e:
+            messagebox.showerror("Error", f"Could not play song:\n{str(e)}")
+            self.stop_song()
+
     def _backend_pause(self) -> None:
+        if self._pending_play or self._backend_vlc_pending():
+            # Nothing is playing yet; hold the parked song instead
+            self._pending_paused = True
+            return
         if self._use_vlc and self._vlc_player:
             self._vlc_player.pause()
             return
         pygame.mixer.music.pause()
 
     def _backend_unpause(self) -> None:
+        if self._pending_play or self._backend_vlc_pending():
+            self._pending_paused = False
+            if self._pending_play and not self._backend_vlc_pending():
+                # VLC finished starting (or failed) while paused; start the held song now
+                file_path, self._pending_play = self._pending_play, None
+                self._backend_play(file_path)
+            return
         if self._use_vlc and self._vlc_player:
             # VLC pause toggles; if paused, calling pause resumes
             self._vlc_player.pause()
@@ -977,6 +1756,11 @@ class MusicPlayer:
         pygame.mixer.music.unpause()
 
     def _backend_stop(self) -> None:
+        self._pending_play = None
+        self._pending_paused = False
+        self._vlc_play_token += 1
+        if self._backend_vlc_pending():
+            return  # Nothing has been started yet
         if self._use_vlc and self._vlc_player:
             self._vlc_player.stop()
             return
@@ -987,11 +1771,11 @@ class MusicPlayer:
             try:
                 # VLC: 1=playing, 0=stopped, 2=paused
                 return self._vlc_player.is_playing() == 1
-            except Exception:
+            except (vlc.VLCException, AttributeError):
                 return False
         try:
             return pygame.mixer.music.get_busy()
-        except Exception:
+        except pygame.error:
             return False
 
     def _backend_set_volume(self, volume_0_to_1: float) -> None:
@@ -1017,16 +1801,56 @@ class MusicPlayer:
             ms = self._vlc_player.get_length()
             return max(0.0, ms / 1000.0) if ms and ms > 0 else 0.0
 
-        # pygame doesn't reliably provide duration; use mutagen as fallback
+        # pygame doesn't reliably provide duration; mutagen reads it on the metadata
+        # worker and this reports 0.0 until the result is in
+        return self._duration_cache.get(self._current_duration_key, 0.0)
+
+    def _request_duration(self, file_path: str):
+        """Return the (path, mtime) duration cache key, queueing a parse on a cache miss"""
+        # play_song has just checked the file, or _prefetch stat'ed it on the worker
+        key = self._file_key(file_path)
+        if key is not None and key not in self._duration_cache:
+            self._meta_pool.submit(self._parse_duration, file_path, key)
+        return key
+
+    def _prefetch(self, file_path: str) -> None:
+        """Stat the next track and parse its title and length ahead of time (metadata worker)"""
         try:
-            if self.current_index < len(self.current_playlist):
-                file_path = self.current_playlist[self.current_index]
-                audio_file = MutagenFile(file_path)
-                if audio_file is not None and getattr(audio_file, "info", None):
-                    return float(audio_file.info.length)
+            key = (file_path, os.stat(file_path).st_mtime)
+        except FileNotFoundError:
+            self._remember_file_key(file_path, None)
+            return
+        except OSError:
+            return  # Left for play_song to check again
+        self._remember_file_key(file_path, key)
+        if not self._use_vlc:
+            self._parse_duration(file_path, key)
+        self._prewarm_title(file_path)
+
+    def _parse_duration(self, file_path: str, key) -> None:
+        """Read the track length with mutagen (runs on the metadata worker)"""
+        if key in self._duration_cache:
+            return
+        duration = 0.0
+        try:
+            audio_file = MutagenFile(file_path)
+            if audio_file is not None and getattr(audio_file, "info", None):
+                duration = float(audio_file.info.length)
         except Exception:
             pass
-        return 0.0
+        # A single dict store; the Tk thread only ever reads this cache
+        self._duration_cache[key] = duration
+    
+    def _toast(self, msg):
+        """Show a confirmation in the status label without blocking; it clears after 1.5 s"""
+        self.status_label.config(text=msg)
+        if self._toast_after_id is not None:
+            self.root.after_cancel(self._toast_after_id)
+        self._toast_after_id = self.root.after(1500, self._clear_toast)
+    
+    def _clear_toast(self):
+        self._toast_after_id = None
+        self.status_label.config(text="")
     
     def show_song_context_menu(self, event):
         """Show context menu for song list"""
@@ -1040,37 +1864,49 @@ class MusicPlayer:
         
         file_path = self.current_playlist[index]
         
-        menu = tk.Menu(self.root, tearoff=0, bg=self.colors['bg_tertiary'], fg=self.colors['text'],
-                      activebackground=self.colors['accent'], activeforeground="#ffffff",
-                      font=("Segoe UI", 10))
+        # The menus are built once and refilled on every right-click
+        if self._song_ctx_menu is None:
+            self._song_ctx_menu = tk.Menu(self.root, tearoff=0, bg=self.colors['bg_tertiary'], fg=self.colors['text'],
+                                          activebackground=self.colors['accent'], activeforeground="#ffffff",
+                                          font=("Segoe UI", 10))
+            self._playlist_submenu = tk.Menu(self._song_ctx_menu, tearoff=0, bg=self.colors['bg_tertiary'],
+                                             fg=self.colors['text'], activebackground=self.colors['accent'],
+                                             activeforeground="#ffffff", font=("Segoe UI", 10))
+        menu = self._song_ctx_menu
+        playlist_menu = self._playlist_submenu
+        menu.delete(0, 'end')
+        playlist_menu.delete(0, 'end')
         
         # Add to Favourite
-        if file_path not in self.favourites:
+        if file_path not in self._favourites_set:
             menu.add_command(label="❤️ Add to Favourites", command=lambda: self.add_to_favourites(file_path))
         else:
-            menu.add_command(label="💔 Remove from Favourites", command=lambda: self.remove_from_favourites(file_path))
+            # When the row belongs to the list being edited, its index spares the search
+            fav_index = index if self.current_playlist is self.favourites else None
+            menu.add_command(label="💔 Remove from Favourites",
+                             command=lambda: self.remove_from_favourites(file_path, fav_index))
         
         menu.add_separator()
         
         # Add to playlist submenu
-        playlist_menu = tk.Menu(menu, tearoff=0, bg=self.colors['bg_tertiary'], fg=self.colors['text'],
-                               activebackground=self.colors['accent'], activeforeground="#ffffff",
-                               font=("Segoe UI", 10))
-        
-        for playlist_name in self.playlists.keys():
-            if playlist_name not in ["All", "Favourite"]:
-                if file_path not in self.playlists[playlist_name]:
+        has_user_playlist = False
+        memberships = self._song_memberships(file_path)
+        for playlist_name in self.playlists:
+            if playlist_name not in _RESERVED:
+                has_user_playlist = True
+                if playlist_name not in memberships:
                     playlist_menu.add_command(
                         label=playlist_name,
                         command=lambda pn=playlist_name: self.add_song_to_playlist(file_path, pn)
                     )
                 else:
+                    row = index if self.current_playlist_name == playlist_name else None
                     playlist_menu.add_command(
                         label=f"{playlist_name} (✓)",
-                        command=lambda pn=playlist_name: self.remove_song_from_playlist(file_path, pn)
+                        command=lambda pn=playlist_name, i=row: self.remove_song_from_playlist(file_path, pn, i)
                     )
         
-        if len([p for p in self.playlists.keys() if p not in ["All", "Favourite"]]) > 0:
+        if has_user_playlist:
             menu.add_cascade(label="📋 Add to Playlist", menu=playlist_menu)
         
         # Remove from current playlist (if not "All")
@@ -1086,28 +1922,17 @@ class MusicPlayer:
         finally:
             menu.grab_release()
     
-    def show_playlist_context_menu(self, event, playlist_name=None):
-        """Show context menu for playlist item"""
-        if playlist_name is None:
-            # Find which playlist was clicked
-            y = event.y_root - self.playlists_canvas.winfo_rooty()
-            for name, item in self.playlist_items.items():
-                if name in ["All"]:  # Can't delete default playlists
-                    continue
-                try:
-                    item_y = item.winfo_rooty() - self.playlists_canvas.winfo_rooty()
-                    if 0 <= y - item_y <= item.winfo_height():
-                        playlist_name = name
-                        break
-                except:
-                    continue
-        
-        if not playlist_name or playlist_name in ["All", "Favourite"]:
+    def show_playlist_context_menu(self, event, playlist_name):
+        """Show context menu for playlist item (the item's binding passes its name)"""
+        if playlist_name in _RESERVED:
             return
         
-        menu = tk.Menu(self.root, tearoff=0, bg=self.colors['bg_tertiary'], fg=self.colors['text'],
-                      activebackground="#f44336", activeforeground="#ffffff",
-                      font=("Segoe UI", 10))
+        if self._playlist_ctx_menu is None:
+            self._playlist_ctx_menu = tk.Menu(self.root, tearoff=0, bg=self.colors['bg_tertiary'],
+                                              fg=self.colors['text'], activebackground="#f44336",
+                                              activeforeground="#ffffff", font=("Segoe UI", 10))
+        menu = self._playlist_ctx_menu
+        menu.delete(0, 'end')
         
         menu.add_command(
             label=f"🗑️ Delete Playlist '{playlist_name}'",
@@ -1119,44 +1944,81 @@ class MusicPlayer:
         finally:
             menu.grab_release()
     
+    def _playlist_set(self, playlist_name):
+        """Membership set for a playlist, built the first time it is needed"""
+        members = self._playlist_sets.get(playlist_name)
+        if members is None:
+            members = set(self.playlists[playlist_name])
+            self._playlist_sets[playlist_name] = members
+        return members
+    
+    def _song_memberships(self, file_path):
+        """Names of the custom playlists that contain file_path"""
+        if self._song_to_playlists is None:
+            index = {}
+            for playlist_name in self.playlists:
+                if playlist_name not in _RESERVED:
+                    for path in self.playlists[playlist_name]:
+                        index.setdefault(path, set()).add(playlist_name)
+            self._song_to_playlists = index
+        return self._song_to_playlists.get(file_path, ())
+    
+    def _playlist_append(self, playlist_name, file_path):
+        self.playlists[playlist_name].append(file_path)
+        self._playlist_set(playlist_name).add(file_path)
+        if self._song_to_playlists is not None and playlist_name not in _RESERVED:
+            self._song_to_playlists.setdefault(file_path, set()).add(playlist_name)
+    
+    def _playlist_remove(self, playlist_name, file_path, index=None):
+        """Remove file_path from a playlist; a known position avoids the list.remove scan"""
+        items = self.playlists[playlist_name]
+        if index is not None and index < len(items) and items[index] == file_path:
+            del items[index]
+        else:
+            items.remove(file_path)
+        self._playlist_set(playlist_name).discard(file_path)
+        if self._song_to_playlists is not None:
+            self._unindex_song(file_path, playlist_name)
+    
+    def _unindex_song(self, file_path, playlist_name):
+        names = self._song_to_playlists.get(file_path)
+        if names is not None:
+            names.discard(playlist_name)
+            if not names:
+                del self._song_to_playlists[file_path]
+    
     def add_to_favourites(self, file_path):
         """Add song to favourites"""
-        if file_path not in self.favourites:
-            self.favourites.append(file_path)
-            self.playlists["Favourite"].append(file_path)
+        if file_path not in self._favourites_set:
+            self._playlist_append("Favourite", file_path)
             if self.current_playlist_name == "Favourite":
-                self.current_playlist.append(file_path)
-                self.update_song_list_display()
-            messagebox.showinfo("Success", "Added to Favourites!")
-    
-    def remove_from_favourites(self, file_path):
-        """Remove song from favourites"""
-        if file_path in self.favourites:
-            self.favourites.remove(file_path)
-            self.playlists["Favourite"].remove(file_path)
+                self._schedule_list_refresh()
+            self._toast("Added to Favourites!")
+    
+    def remove_from_favourites(self, file_path, index=None):
+        """Remove song from favourites (index: its position there, if known)"""
+        if file_path in self._favourites_set:
+            self._playlist_remove("Favourite", file_path, index)
             if self.current_playlist_name == "Favourite":
-                self.current_playlist.remove(file_path)
-                self.update_song_list_display()
-            messagebox.showinfo("Success", "Removed from Favourites!")
+                self._schedule_list_refresh()
+            self._toast("Removed from Favourites!")
     
     def add_song_to_playlist(self, file_path, playlist_name):
         """Add song to a playlist"""
         if playlist_name in self.playlists:
-            if file_path not in self.playlists[playlist_name]:
-                self.playlists[playlist_name].append(file_path)
+            if file_path not in self._playlist_set(playlist_name):
+                self._playlist_append(playlist_name, file_path)
                 if self.current_playlist_name == playlist_name:
-                    self.current_playlist.append(file_path)
-                    self.update_song_list_display()
-                messagebox.showinfo("Success", f"Added to '{playlist_name}'!")
-    
-    def remove_song_from_playlist(self, file_path, playlist_name):
-        """Remove song from a playlist"""
-        if playlist_name in self.playlists and file_path in self.playlists[playlist_name]:
-            self.playlists[playlist_name].remove(file_path)
+                    self._schedule_list_refresh()
+                self._toast(f"Added to '{playlist_name}'!")
+    
+    def remove_song_from_playlist(self, file_path, playlist_name, index=None):
+        """Remove song from a playlist (index: its position there, if known)"""
+        if playlist_name in self.playlists and file_path in self._playlist_set(playlist_name):
+            self._playlist_remove(playlist_name, file_path, index)
             if self.current_playlist_name == playlist_name:
-                self.current_playlist.remove(file_path)
-                self.update_song_list_display()
-            messagebox.showinfo("Success", f"Removed from '{playlist_name}'!")
+                self._schedule_list_refresh()
+            self._toast(f"Removed from '{playlist_name}'!")
     
     def remove_song_from_current_playlist(self, index):
         """Remove song from current playlist"""
@@ -1164,26 +2026,30 @@ class MusicPlayer:
             file_path = self.current_playlist[index]
             playlist_name = self.current_playlist_name
             
-            if playlist_name in self.playlists and file_path in self.playlists[playlist_name]:
-                self.playlists[playlist_name].remove(file_path)
-                self.current_playlist.remove(file_path)
-                self.update_song_list_display()
+            if playlist_name in self.playlists and file_path in self._playlist_set(playlist_name):
+                # The view is the playlist's own list, so the row index is its position
+                self._playlist_remove(playlist_name, file_path, index)
+                self._schedule_list_refresh()
                 
                 # Update current index if needed
                 if index <= self.current_index and self.current_index > 0:
                     self.current_index -= 1
                 
-                messagebox.showinfo("Success", "Removed from playlist!")
+                self._toast("Removed from playlist!")
     
     def delete_playlist(self, playlist_name):
         """Delete a playlist"""
-        if playlist_name in ["All", "Favourite"]:
+        if playlist_name in _RESERVED:
             messagebox.showwarning("Warning", "Cannot delete default playlists!")
             return
         
         if messagebox.askyesno("Confirm", f"Are you sure you want to delete '{playlist_name}'?"):
             # Remove playlist
+            if self._song_to_playlists is not None:
+                for path in self.playlists[playlist_name]:
+                    self._unindex_song(path, playlist_name)
             del self.playlists[playlist_name]
+            self._playlist_sets.pop(playlist_name, None)
             
             # Remove from sidebar
             if playlist_name in self.playlist_items:
@@ -1194,7 +2060,7 @@ class MusicPlayer:
             if self.current_playlist_name == playlist_name:
                 self.select_playlist("All")
             
-            messagebox.showinfo("Success", f"Playlist '{playlist_name}' deleted!")
+            self._toast(f"Playlist '{playlist_name}' deleted!")
 
 
 def main():